@@ -0,0 +1,131 @@
+# recon_logic.py
+import numpy as np
+import pandas as pd
+
+# Presence bits, one per source, OR-ed together per stock number
+IN_DMS = 1
+IN_AUTOTRADER = 2
+IN_CARS = 4
+IN_PMGWEB = 8
+
+DMS_COLUMNS = [
+    "Stock Number", "Make", "Model", "Specification", "Odometer", "Registration Date",
+    "VIN", "Customer Order", "Photo Count", "Selling Price", "Stand In Value",
+    "Stock Days", "Internet Price", "Vehicle Code"
+]
+
+UPLOAD_COLUMNS = [
+    "Stock Number", "Make", "Model", "Specification", "Colour",
+    "Registration Date", "VIN", "Odometer"
+]
+
+DEALERSHIP_PREFIXES = [
+    ("FordNelspruit", "UF"),
+    ("MazdaNelspruit", "UG"),
+    ("ProduktaNissan", "UA"),
+    ("SuzukiNelspruit", "UE"),
+    ("FordMalalane", "US"),
+]
+# The dealer split groups on a fixed-length stock prefix, so all prefixes must share it
+PREFIX_LENGTH = len(DEALERSHIP_PREFIXES[0][1])
+assert all(len(prefix) == PREFIX_LENGTH for _, prefix in DEALERSHIP_PREFIXES), \
+    "DEALERSHIP_PREFIXES must all have the same length"
+
+LISTING_STOCK_COLUMNS = ["Stock Number", "Reference", "StockNumber", "Ref"]
+
+
+def normalize_stock_column(df, col_candidates):
+    for col in col_candidates:
+        if col in df.columns:
+            df = df.rename(columns={col: "Stock Number"})
+            df["Stock Number"] = df["Stock Number"].astype(str).str.strip().str.upper()
+            break
+    return df
+
+
+def combine_listings(dealership_data: dict, key: str) -> pd.DataFrame:
+    """Stack one channel's listings across all dealerships with a normalised Stock Number."""
+    frames = [normalize_stock_column(data[key], LISTING_STOCK_COLUMNS)
+              for data in dealership_data.values() if key in data]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def _stock_series(df: pd.DataFrame) -> pd.Series:
+    if "Stock Number" in df.columns:
+        return df["Stock Number"]
+    return pd.Series(index=df.index, dtype=object)
+
+
+def build_presence_table(sources) -> pd.Series:
+    """Hash every stock number once into a stock_number -> presence bits table.
+
+    `sources` is an iterable of (bit, Series of stock numbers). Each source is
+    de-duplicated and the bits are distinct, so summing per stock number is the OR.
+    """
+    tables = [pd.Series(bit, index=pd.unique(stock.dropna()), dtype=int) for bit, stock in sources]
+    return pd.concat(tables).groupby(level=0, sort=False).sum()
+
+
+def _lookup(stock: pd.Series, presence: pd.Series) -> pd.Series:
+    return stock.map(presence).fillna(0).astype(int)
+
+
+def reconcile(dms_data: pd.DataFrame,
+              pmg_web_data: pd.DataFrame,
+              dealership_data: dict) -> dict:
+    """Reconcile DMS stock against AutoTrader, Cars.co.za and PMG web listings.
+
+    Returns a dict of DataFrames ready to be written out:
+    'dealerships' ({dealership: DMS rows with on_cars/on_autotrader/on_pmgweb flags}),
+    'autotrader', 'cars', 'pmg_web' (normalised listings),
+    'to_remove_autotrader', 'to_remove_cars', 'to_remove_pmgweb' (listed but not in DMS)
+    and 'upload_to_pmgweb' (in DMS, on AutoTrader or Cars, but not on PMG web).
+    """
+    dms_data = normalize_stock_column(dms_data, ["Stock Number"])
+    pmg_web_data = normalize_stock_column(pmg_web_data, ["SKU"])
+    autotrader_combined = combine_listings(dealership_data, 'autotrader')
+    cars_combined = combine_listings(dealership_data, 'cars')
+
+    dms_stock = _stock_series(dms_data)
+    autotrader_stock = _stock_series(autotrader_combined)
+    cars_stock = _stock_series(cars_combined)
+    web_stock = _stock_series(pmg_web_data)
+
+    presence = build_presence_table([
+        (IN_DMS, dms_stock),
+        (IN_AUTOTRADER, autotrader_stock),
+        (IN_CARS, cars_stock),
+        (IN_PMGWEB, web_stock),
+    ])
+
+    # One hash lookup per row, every flag and set below is a bit test on these
+    dms_bits = _lookup(dms_stock, presence)
+    on_autotrader = (dms_bits & IN_AUTOTRADER).astype(bool)
+    on_cars = (dms_bits & IN_CARS).astype(bool)
+    on_pmgweb = (dms_bits & IN_PMGWEB).astype(bool)
+
+    flagged = dms_data[[col for col in DMS_COLUMNS if col in dms_data.columns]].assign(
+        on_cars=on_cars, on_autotrader=on_autotrader, on_pmgweb=on_pmgweb)
+
+    # Split DMS rows by stock prefix in one grouping pass
+    dms_prefix = dms_stock.astype(str).str[:PREFIX_LENGTH]
+    positions = dms_prefix.groupby(dms_prefix, sort=False).indices
+    no_rows = np.array([], dtype=int)
+    dealerships = {dealership: flagged.iloc[positions.get(prefix, no_rows)].copy()
+                   for dealership, prefix in DEALERSHIP_PREFIXES}
+
+    to_upload_web = dms_data.loc[(on_autotrader | on_cars) & ~on_pmgweb,
+                                 [col for col in UPLOAD_COLUMNS if col in dms_data.columns]].copy()
+
+    return {
+        'dealerships': dealerships,
+        'autotrader': autotrader_combined,
+        'cars': cars_combined,
+        'pmg_web': pmg_web_data,
+        'to_remove_autotrader': autotrader_combined[~(_lookup(autotrader_stock, presence) & IN_DMS).astype(bool)].copy(),
+        'to_remove_cars': cars_combined[~(_lookup(cars_stock, presence) & IN_DMS).astype(bool)].copy(),
+        'to_remove_pmgweb': pmg_web_data[~(_lookup(web_stock, presence) & IN_DMS).astype(bool)].copy(),
+        'upload_to_pmgweb': to_upload_web,
+    }
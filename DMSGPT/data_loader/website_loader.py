@@ -1,7 +1,7 @@
 # website_loader.py
 import pandas as pd
 from pathlib import Path
-import warnings
+from pmg_common.cars_reader import read_cars_xlsx
 
 def load_pmg_web_data(web_path: Path) -> pd.DataFrame:
     """Load the PMG web CSV export."""
@@ -25,9 +25,7 @@ def load_dealership_data(dealership_dir: Path) -> dict:
         data['autotrader'] = pd.DataFrame()
 
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            data['cars'] = pd.read_excel(cars_path, engine='openpyxl')
+        data['cars'] = read_cars_xlsx(cars_path)
     except Exception as e:
         print(f"Error loading {cars_path}: {e}")
         data['cars'] = pd.DataFrame()
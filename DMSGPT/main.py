@@ -2,6 +2,7 @@
 from pathlib import Path
 from .data_loader.dms_loader import load_dms_data
 from .data_loader.website_loader import load_pmg_web_data, load_dealership_data
+from .Processor.recon_logic import reconcile
 from .exporter.excel_report import write_master_excel
 
 def main():
@@ -31,9 +32,12 @@ def main():
               "AutoTrader:", dealership_data[name]['autotrader'].shape,
               "Cars:", dealership_data[name]['cars'].shape)
 
+    # Reconcile DMS stock against all listing channels
+    recon = reconcile(dms_data, pmg_web_data, dealership_data)
+
     # Output Excel workbook
     output_path = base_path.parent / "master_vehicle_report.xlsx"
-    write_master_excel(dms_data, pmg_web_data, dealership_data, output_path)
+    write_master_excel(recon, output_path)
     print(f"Master Excel workbook saved to {output_path}")
 
 if __name__ == "__main__":
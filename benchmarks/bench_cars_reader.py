@@ -0,0 +1,64 @@
+# bench_cars_reader.py
+"""Compare read_cars_xlsx against pd.read_excel(engine='openpyxl') on a large Cars.co.za sheet.
+
+Run from the repository root:
+    python -m benchmarks.bench_cars_reader [rows]
+"""
+import sys
+import tempfile
+import warnings
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+from pmg_common.cars_reader import read_cars_xlsx
+
+from .bench_utils import best_of
+
+HEADER = ["Vehicle_Name", "Cars_ID", "Reference", "Type", "Year", "Mileage", "Price", "Listed"]
+
+
+def make_cars_xlsx(path: Path, rows: int):
+    """Write a synthetic inventory sheet shaped like the real cars.xlsx exports."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Stock")
+    ws.append(HEADER)
+    for i in range(rows):
+        ws.append([
+            f"Ford Ranger 2.0D Bi-Turbo Wildtrak 4X4 Double Cab Auto #{i}",
+            10_000_000 + i,
+            f"UF{i:06d}",
+            "Used",
+            2015 + i % 10,
+            f"{(i * 37) % 200} 000 Km",
+            f"R {300 + i % 500} 900",
+            datetime(2024, 1, 1) + timedelta(minutes=i),
+        ])
+    wb.save(path)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cars.xlsx"
+        make_cars_xlsx(path, rows)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            t_openpyxl, expected = best_of(lambda: pd.read_excel(path, engine="openpyxl"))
+        t_full, full = best_of(lambda: read_cars_xlsx(path))
+        t_proj, proj = best_of(lambda: read_cars_xlsx(path, usecols=["Reference", "Price"]))
+
+    pd.testing.assert_frame_equal(expected, full)
+    pd.testing.assert_frame_equal(expected[["Reference", "Price"]], proj)
+
+    print(f"rows: {rows}")
+    print(f"pd.read_excel (openpyxl):          {t_openpyxl:.3f}s")
+    print(f"read_cars_xlsx (all columns):      {t_full:.3f}s  x{t_openpyxl / t_full:.1f}")
+    print(f"read_cars_xlsx (Reference, Price): {t_proj:.3f}s  x{t_openpyxl / t_proj:.1f}")
+
+
+if __name__ == "__main__":
+    main()
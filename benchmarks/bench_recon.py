@@ -0,0 +1,100 @@
+# bench_recon.py
+"""Compare reconcile() against the previous isin-based reconciliation on a large synthetic tree.
+
+Run from the repository root:
+    python -m benchmarks.bench_recon [dms_rows]
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from DMSGPT.Processor.recon_logic import (
+    DEALERSHIP_PREFIXES, DMS_COLUMNS, LISTING_STOCK_COLUMNS, UPLOAD_COLUMNS, normalize_stock_column, reconcile
+)
+
+from .bench_utils import best_of
+
+
+def make_tree(dms_rows: int, seed: int = 0):
+    """Synthetic DMS/web/AutoTrader/Cars frames with overlapping and stale stock numbers."""
+    rng = np.random.default_rng(seed)
+    prefixes = np.array([prefix for _, prefix in DEALERSHIP_PREFIXES] + ["NX"])
+
+    def stock_numbers(n, universe):
+        ids = rng.integers(0, universe, n)
+        return pd.Series(prefixes[ids % len(prefixes)]).str.cat(pd.Series(ids).astype(str))
+
+    universe = dms_rows * 2  # about half of every listing channel is stale
+    dms = pd.DataFrame({
+        "Stock Number": stock_numbers(dms_rows, universe).str.lower(),
+        "Make": "Ford", "Model": "Ranger", "Colour": "White", "VIN": "X", "Odometer": 1000,
+    })
+    web = pd.DataFrame({"SKU": stock_numbers(dms_rows // 2, universe), "Name": "Vehicle"})
+    listing_rows = dms_rows // 5
+    dealership_data = {
+        f"dealer{i}": {
+            'autotrader': pd.DataFrame({"StockNumber": stock_numbers(listing_rows, universe), "Price": 1}),
+            'cars': pd.DataFrame({"Reference": stock_numbers(listing_rows, universe), "Price": "R 1"}),
+        }
+        for i in range(5)
+    }
+    return dms, web, dealership_data
+
+
+def baseline_reconcile(dms_data, pmg_web_data, dealership_data):
+    """The reconciliation as write_master_excel used to do it, with repeated isin calls."""
+    dms_data = normalize_stock_column(dms_data, ["Stock Number"])
+    pmg_web_data = normalize_stock_column(pmg_web_data, ["SKU"])
+    autotrader_combined = pd.concat(
+        [normalize_stock_column(data['autotrader'], LISTING_STOCK_COLUMNS) for data in dealership_data.values()],
+        ignore_index=True)
+    cars_combined = pd.concat(
+        [normalize_stock_column(data['cars'], LISTING_STOCK_COLUMNS) for data in dealership_data.values()],
+        ignore_index=True)
+
+    dealerships = {}
+    for dealership, prefix in DEALERSHIP_PREFIXES:
+        df_filtered = dms_data[dms_data['Stock Number'].astype(str).str.startswith(prefix)].copy()
+        df_filtered = df_filtered[[col for col in DMS_COLUMNS if col in df_filtered.columns]]
+        df_filtered["on_cars"] = df_filtered["Stock Number"].isin(cars_combined["Stock Number"]).astype(bool)
+        df_filtered["on_autotrader"] = df_filtered["Stock Number"].isin(autotrader_combined["Stock Number"]).astype(bool)
+        df_filtered["on_pmgweb"] = df_filtered["Stock Number"].isin(pmg_web_data["Stock Number"]).astype(bool)
+        dealerships[dealership] = df_filtered
+
+    all_dms_stock = set(dms_data["Stock Number"].unique())
+    to_upload_web = dms_data[
+        (dms_data["Stock Number"].isin(autotrader_combined["Stock Number"]) |
+         dms_data["Stock Number"].isin(cars_combined["Stock Number"]))
+        & ~dms_data["Stock Number"].isin(pmg_web_data["Stock Number"])
+    ].copy()
+
+    return {
+        'dealerships': dealerships,
+        'to_remove_autotrader': autotrader_combined[~autotrader_combined["Stock Number"].isin(all_dms_stock)].copy(),
+        'to_remove_cars': cars_combined[~cars_combined["Stock Number"].isin(all_dms_stock)].copy(),
+        'to_remove_pmgweb': pmg_web_data[~pmg_web_data["Stock Number"].isin(all_dms_stock)].copy(),
+        'upload_to_pmgweb': to_upload_web[[col for col in UPLOAD_COLUMNS if col in to_upload_web.columns]],
+    }
+
+
+def main():
+    dms_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    dms, web, dealership_data = make_tree(dms_rows)
+
+    t_baseline, expected = best_of(lambda: baseline_reconcile(dms, web, dealership_data))
+    t_recon, result = best_of(lambda: reconcile(dms, web, dealership_data))
+
+    for dealership, df in expected['dealerships'].items():
+        pd.testing.assert_frame_equal(df, result['dealerships'][dealership])
+    for key in ("to_remove_autotrader", "to_remove_cars", "to_remove_pmgweb", "upload_to_pmgweb"):
+        pd.testing.assert_frame_equal(expected[key], result[key])
+
+    print(f"DMS rows: {dms_rows}, web rows: {len(web)}, "
+          f"AutoTrader/Cars rows: 5x{dms_rows // 5} each")
+    print(f"isin baseline: {t_baseline:.3f}s")
+    print(f"reconcile():   {t_recon:.3f}s  x{t_baseline / t_recon:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+# bench_utils.py
+import time
+
+
+def best_of(fn, repeat=3):
+    """Run `fn` `repeat` times and return (fastest wall time in seconds, last result)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
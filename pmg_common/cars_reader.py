@@ -0,0 +1,221 @@
+# cars_reader.py
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, WINDOWS_EPOCH, from_ISO8601, from_excel
+from pandas.io.parsers import TextParser
+
+NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+SHEET_DATA = NS + "sheetData"
+ROW = NS + "row"
+CELL = NS + "c"
+VALUE = NS + "v"
+TEXT = NS + "t"
+INLINE = NS + "is"
+RUN = NS + "r"
+
+
+def _column_index(ref: str) -> int:
+    """Turn the letters of a cell reference like 'AB12' into a 0-based column index."""
+    idx = 0
+    for ch in ref:
+        if ch.isdigit():
+            break
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx - 1
+
+
+def _string_item_text(si) -> str:
+    """Text of a shared/inline string item, joining rich text runs and skipping phonetics."""
+    t = si.find(TEXT)
+    if t is not None:
+        return t.text or ""
+    return "".join(r.findtext(TEXT, "") for r in si.iter(RUN))
+
+
+def _workbook_parts(zf: zipfile.ZipFile):
+    """Locate the first worksheet, shared strings and styles parts and the date epoch."""
+    rels = {}
+    parts = {"sharedStrings": None, "styles": None}
+    for rel in ET.fromstring(zf.read("xl/_rels/workbook.xml.rels")).iter(PKG_REL_NS + "Relationship"):
+        target = rel.get("Target")
+        target = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+        rels[rel.get("Id")] = target
+        kind = rel.get("Type", "").rsplit("/", 1)[-1]
+        if kind in parts:
+            parts[kind] = target
+
+    workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+    workbook_pr = workbook.find(NS + "workbookPr")
+    date1904 = workbook_pr is not None and workbook_pr.get("date1904", "false").lower() in ("1", "true")
+    first_sheet = next(workbook.iter(NS + "sheet"))
+    return (rels[first_sheet.get(REL_NS + "id")], parts["sharedStrings"], parts["styles"],
+            CALENDAR_MAC_1904 if date1904 else WINDOWS_EPOCH)
+
+
+def _read_date_styles(zf: zipfile.ZipFile, path) -> dict:
+    """Map the cell style ids (the `s` attribute) that carry a date number format.
+
+    Values are True for elapsed-time formats such as [h]:mm, which openpyxl reads as timedeltas.
+    """
+    if path is None or path not in zf.namelist():
+        return {}
+    styles = ET.fromstring(zf.read(path))
+    custom = {int(fmt.get("numFmtId")): fmt.get("formatCode", "")
+              for fmt in styles.iter(NS + "numFmt")}
+    date_styles = {}
+    cell_xfs = styles.find(NS + "cellXfs")
+    for style_id, xf in enumerate(cell_xfs if cell_xfs is not None else []):
+        fmt_id = int(xf.get("numFmtId", 0))
+        fmt = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+        if fmt and is_date_format(fmt):
+            date_styles[str(style_id)] = is_timedelta_format(fmt)
+    return date_styles
+
+
+def _read_shared_strings(zf: zipfile.ZipFile, path) -> list:
+    if path is None or path not in zf.namelist():
+        return []
+    strings = []
+    root = None
+    with zf.open(path) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event == "end" and elem.tag == NS + "si":
+                strings.append(_string_item_text(elem))
+                root.clear()  # drop the finished item from <sst>
+    return strings
+
+
+def _cell_value(c, shared_strings, date_styles, epoch):
+    """Decode a cell the way pandas' openpyxl reader does."""
+    t = c.get("t", "n")
+    if t == "inlineStr":
+        si = c.find(INLINE)
+        return _string_item_text(si) if si is not None else ""
+    text = c.findtext(VALUE)
+    if text is None or text == "":
+        return ""
+    if t == "s":
+        return shared_strings[int(text)]
+    if t == "n":
+        val = float(text)
+        val = int(val) if val.is_integer() else val
+        style = c.get("s")
+        if style in date_styles:
+            try:
+                return from_excel(val, epoch, timedelta=date_styles[style])
+            except (OverflowError, ValueError):
+                return np.nan  # openpyxl turns out-of-range date serials into #VALUE! errors
+        return val
+    if t == "b":
+        return text == "1"
+    if t == "e":
+        return np.nan
+    if t == "d":
+        return from_ISO8601(text)
+    return text  # "str": cached formula result
+
+
+def _has_value(c) -> bool:
+    return c.find(VALUE) is not None or c.find(INLINE) is not None
+
+
+def read_cars_xlsx(cars_path: Path, usecols=None) -> pd.DataFrame:
+    """Fast reader for Cars.co.za `cars.xlsx` exports.
+
+    Streams the first sheet's XML instead of building openpyxl cell objects, only
+    reads the number formats from the styles to recognise dates, ignores formulas
+    (cached results are used) and, when `usecols` is given as a list of header names
+    or a callable on the header, only decodes those columns. The result matches
+    `pd.read_excel(..., engine='openpyxl')` for text, numeric, boolean, error and
+    date cells.
+
+    As with `pd.read_excel`, sheet row 1 is the header whether or not `usecols` is
+    given, and a ValueError is raised when a listed column is not in it.
+    """
+    with zipfile.ZipFile(cars_path) as zf:
+        sheet_path, shared_strings_path, styles_path, epoch = _workbook_parts(zf)
+        shared_strings = _read_shared_strings(zf, shared_strings_path)
+        date_styles = _read_date_styles(zf, styles_path)
+
+        keep = None  # column indices to decode, None for all
+        kept = []
+        row_number = -1
+        data = []
+        last_row_with_data = -1
+        sheet_data = None
+        with zf.open(sheet_path) as f:
+            for event, row in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if row.tag == SHEET_DATA:
+                        sheet_data = row
+                    continue
+                if row.tag != ROW:
+                    continue
+                ref = row.get("r")
+                row_number = int(ref) - 1 if ref else row_number + 1
+
+                values = {}
+                has_data = False
+                col = -1
+                for c in row.iter(CELL):
+                    ref = c.get("r")
+                    col = _column_index(ref) if ref else col + 1
+                    if keep is None or col in keep:
+                        value = _cell_value(c, shared_strings, date_styles, epoch)
+                        if value != "":
+                            values[col] = value
+                            has_data = True
+                    elif not has_data and _has_value(c):
+                        has_data = True
+                # Finished rows hang off <sheetData>, so clear it rather than just the row
+                sheet_data.clear()
+
+                if keep is None and usecols is not None:
+                    # Sheet row 1 is the header: work out the projection from it
+                    header = values if row_number == 0 else {}
+                    if callable(usecols):
+                        keep = {i for i, name in header.items() if usecols(name)}
+                    else:
+                        missing = [name for name in usecols if name not in header.values()]
+                        if missing:
+                            raise ValueError(f"Usecols do not match columns in {cars_path}, "
+                                             f"columns expected but not found: {missing}")
+                        keep = {i for i, name in header.items() if name in usecols}
+                    kept = sorted(keep)
+                    values = {i: values[i] for i in keep}
+
+                while len(data) < row_number:
+                    data.append([])
+
+                if keep is None:
+                    converted_row = [""] * (max(values) + 1 if values else 0)
+                    for i, value in values.items():
+                        converted_row[i] = value
+                else:
+                    converted_row = [values.get(i, "") for i in kept]
+                    while converted_row and converted_row[-1] == "":
+                        converted_row.pop()
+
+                if has_data:
+                    last_row_with_data = len(data)
+                data.append(converted_row)
+
+    # Trim trailing empty rows and pad to a rectangle, as pandas does for openpyxl
+    data = data[: last_row_with_data + 1]
+    if not data or not any(data):
+        return pd.DataFrame()
+    max_width = max(len(data_row) for data_row in data)
+    data = [data_row + [""] * (max_width - len(data_row)) for data_row in data]
+
+    return TextParser(data, header=0, skip_blank_lines=False).read()
@@ -1,5 +1,6 @@
 import os
 import pandas as pd
+from pmg_common.cars_reader import read_cars_xlsx
 from .utilities import read_csv_with_sep_check
 
 def read_autotrader_data(folder):
@@ -28,10 +29,18 @@ def read_cars_data(folder):
         if not os.path.isdir(subdir): continue
         file = os.path.join(subdir, "cars.xlsx")
         if not os.path.isfile(file): continue
-        df = pd.read_excel(file)
-        df.columns = df.columns.str.strip()
+        # Only the stock reference and price columns are used
+        try:
+            df = read_cars_xlsx(file, usecols=lambda c: str(c).strip() in ("Reference", "Stock Number") or "price" in str(c).lower())
+        except Exception as e:
+            print(f"[WARN] Could not read {file}: {e}")
+            continue
+        df.columns = df.columns.astype(str).str.strip()
         if "Reference" in df.columns:
             df.rename(columns={"Reference": "Stock Number"}, inplace=True)
+        if "Stock Number" not in df.columns:
+            print(f"[WARN] No Reference or Stock Number column in {file}, skipping")
+            continue
         price_col = next((c for c in df.columns if "price" in c.lower()), None)
         for _, row in df.iterrows():
             sn = str(row.get("Stock Number", "")).strip()